@@ -71,12 +71,12 @@ namespace fastscapelib
             shape_type donors_shape = {grid.size(), grid_type::max_neighbors()+1};
 
             m_receivers = xt::ones<index_type>(receivers_shape) * -1;
-            m_receivers_count = xt::zeros<index_type>({grid.size()});
+            m_receivers_count = xt::zeros<neighbors_count_type>({grid.size()});
             m_receivers_distance = xt::ones<distance_type>(receivers_shape) * -1;
             m_receivers_weight = xt::zeros<double>(receivers_shape);
 
             m_donors = xt::ones<index_type>(donors_shape) * -1;
-            m_donors_count = xt::zeros<index_type>({grid.size()});
+            m_donors_count = xt::zeros<neighbors_count_type>({grid.size()});
 
             m_dfs_stack = xt::ones<index_type>({grid.size()}) * -1;
         }
@@ -125,6 +125,9 @@ namespace fastscapelib
     
         using shape_type = typename xt_container_t<S, index_type, 2>::shape_type;
 
+        template <class T, class F>
+        void accumulate_impl(T& acc, F&& node_value) const;
+
         G& m_grid;
 
         donors_type m_donors;
@@ -145,25 +148,36 @@ namespace fastscapelib
     };
 
     template <class G, class elev_t, class S>
-    template <class T>
-    auto flow_graph<G, elev_t, S>::accumulate(const T& data) const
-        -> T
+    template <class T, class F>
+    void flow_graph<G, elev_t, S>::accumulate_impl(T& acc, F&& node_value) const
     {
-        T acc = xt::zeros_like(data);
-
-        for (auto inode=m_dfs_stack.crbegin(); inode!=m_dfs_stack.crend(); ++inode)
+        for (auto istack=m_dfs_stack.crbegin(); istack!=m_dfs_stack.crend(); ++istack)
         {
-            acc(*inode) += m_grid.node_area(*inode) * data.data()[*inode];
+            const index_type inode = *istack;
+            const neighbors_count_type nreceivers = m_receivers_count[inode];
+
+            acc(inode) += m_grid.node_area(inode) * node_value(inode);
+            const auto acc_inode = acc(inode);
 
-            for (index_type r=0; r<m_receivers_count[*inode]; ++r)
+            for (neighbors_count_type r=0; r<nreceivers; ++r)
             {
-                index_type ireceiver = m_receivers(*inode, r);
-                if (ireceiver != *inode)
+                const index_type ireceiver = m_receivers(inode, r);
+                if (ireceiver != inode)
                 {
-                    acc(ireceiver) += acc(*inode) * m_receivers_weight(*inode, r);
+                    acc(ireceiver) += acc_inode * m_receivers_weight(inode, r);
                 }
             }
         }
+    }
+
+    template <class G, class elev_t, class S>
+    template <class T>
+    auto flow_graph<G, elev_t, S>::accumulate(const T& data) const
+        -> T
+    {
+        T acc = xt::zeros_like(data);
+
+        accumulate_impl(acc, [&data](index_type inode) { return data.data()[inode]; });
 
         return acc;
     }
@@ -172,8 +186,12 @@ namespace fastscapelib
     auto flow_graph<G, elev_t, S>::accumulate(const double& data) const
         -> data_type<double>
     {
-        data_type<double> tmp = xt::ones<double>(m_grid.shape()) * data;
-        return accumulate(tmp);
+        // uniform data: no need to materialize a full array of it
+        data_type<double> acc = xt::zeros<double>(m_grid.shape());
+
+        accumulate_impl(acc, [data](index_type /*inode*/) { return data; });
+
+        return acc;
     }
 }
 
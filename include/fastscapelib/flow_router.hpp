@@ -117,6 +117,7 @@ namespace fastscapelib
         
     private:
         using index_type = typename flow_router<FG>::index_type;
+        using neighbors_count_type = typename FG::neighbors_count_type;
         using stack_type = typename flow_router<FG>::stack_type;
         using donors_count_type = typename flow_router<FG>::donors_count_type;
         using donors_type = typename flow_router<FG>::donors_type;
@@ -129,7 +130,7 @@ namespace fastscapelib
                        const donors_type& donors,
                        const index_type inode)
         {
-            for(index_type k=0; k<ndonors(inode); ++k)
+            for(neighbors_count_type k=0; k<ndonors(inode); ++k)
             {
                 const auto idonor = donors(inode, k);
                 if (idonor!=inode)
@@ -163,7 +164,8 @@ namespace fastscapelib
         {
             using neighbors_type = typename FG::grid_type::neighbors_type;
             
-            double slope, slope_max;
+            double slope, slope_max, irec_distance;
+            index_type irec;
             neighbors_type neighbors;
 
             auto& grid = fgraph.grid();
@@ -176,22 +178,33 @@ namespace fastscapelib
 
             for (auto i : grid.nodes_indices())
             {
-                receivers(i, 0) = i;
-                dist2receivers(i, 0) = 0;
+                irec = i;
+                irec_distance = 0;
                 slope_max = std::numeric_limits<double>::min();
-                
+
+                const auto elevation_i = elevation.data()[i];
+
                 for (auto n : grid.neighbors(i, neighbors))
                 {          
-                    slope = (elevation.data()[i] - elevation.data()[n.idx]) / n.distance;
+                    slope = (elevation_i - elevation.data()[n.idx]) / n.distance;
 
                     if(slope > slope_max)
                     {
                         slope_max = slope;
-                        receivers(i, 0) = n.idx;
-                        dist2receivers(i, 0) = n.distance;
+                        irec = n.idx;
+                        irec_distance = n.distance;
                     }
                 }
-                donors(receivers(i, 0), donors_count(receivers(i, 0))++) = i;
+                receivers(i, 0) = irec;
+                dist2receivers(i, 0) = irec_distance;
+            }
+
+            // donors are scattered in a separate pass so that the loop
+            // above only reads/writes receivers in node order
+            for (auto i : grid.nodes_indices())
+            {
+                irec = receivers(i, 0);
+                donors(irec, donors_count(irec)++) = i;
             }
 
             this->receivers_count(fgraph).fill(1);
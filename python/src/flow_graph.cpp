@@ -19,7 +19,8 @@ void add_flow_graph_bindings(py::module& m) {
                         py::arg("grid"), py::arg("flow_router"), py::arg("sink_resolver") = std::make_shared<no_sink_resolver_method>())
         .def(py::init<fs::raster_grid&, std::shared_ptr<flow_router_method>, std::shared_ptr<sink_resolver_method> >(), 
                         py::arg("grid"), py::arg("flow_router"), py::arg("sink_resolver") = std::make_shared<no_sink_resolver_method>())
-        .def("update_routes", &flow_graph_facade::update_routes)
+        .def("update_routes", &flow_graph_facade::update_routes,
+                        py::call_guard<py::gil_scoped_release>())
         .def("receivers", &flow_graph_facade::receivers)
         .def("receivers_count", &flow_graph_facade::receivers_count)
         .def("receivers_distance", &flow_graph_facade::receivers_distance)